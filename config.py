@@ -4,7 +4,3 @@ BASE_URL = "https://ssc.arcelormittal.com/en/about-ssc/certifications"
 #BASE_URL = "https://ssc.arcelormittal.com/"
 #CSS_SELECTOR = "[class^='info-container']"
 CSS_SELECTOR = ""
-REQUIRED_KEYS = [
-    "document_name",
-    "document_url",
-]
@@ -1,14 +1,17 @@
 import asyncio
+import logging
+import os
 
 from crawl4ai import AsyncWebCrawler
 from dotenv import load_dotenv
 
-from config import BASE_URL, CSS_SELECTOR, REQUIRED_KEYS
+from config import BASE_URL, CSS_SELECTOR
 from utils.data_utils import (
     save_venues_to_csv,
 )
 from utils.scraper_utils import (
     fetch_and_process_page,
+    fetch_and_process_pages_batched,
     get_browser_config,
     get_llm_strategy,
 )
@@ -33,32 +36,43 @@ async def crawl_venues():
     # Start the web crawler context
     # https://docs.crawl4ai.com/api/async-webcrawler/#asyncwebcrawler
     async with AsyncWebCrawler(config=browser_config) as crawler:
-        while True:
-            # Fetch and process data from the current page
-            venues, no_results_found = await fetch_and_process_page(
+        # Batch mode trades latency for the cheaper Groq batch API
+        if os.getenv("LLM_BATCH_MODE") == "1":
+            venues_by_url = await fetch_and_process_pages_batched(
                 crawler,
-                BASE_URL,
+                [BASE_URL],
                 CSS_SELECTOR,
                 llm_strategy,
-                session_id,
-                REQUIRED_KEYS,
                 seen_names,
             )
-
-            if no_results_found:
-                print("No more venues found. Ending crawl.")
-                break  # Stop crawling when "No Results Found" message appears
-
-            if not venues:
-                print(f"No venues extracted from page {page_number}.")
-                break  # Stop if no venues are extracted
-
-            # Add the venues from this page to the total list
-            all_venues.extend(venues)
-            page_number += 1  # Move to the next page
-
-            # Pause between requests to be polite and avoid rate limits
-            await asyncio.sleep(2)  # Adjust sleep time as needed
+            for venues in venues_by_url.values():
+                all_venues.extend(venues)
+        else:
+            while True:
+                # Fetch and process data from the current page
+                venues, no_results_found = await fetch_and_process_page(
+                    crawler,
+                    BASE_URL,
+                    CSS_SELECTOR,
+                    llm_strategy,
+                    session_id,
+                    seen_names,
+                )
+
+                if no_results_found:
+                    print("No more venues found. Ending crawl.")
+                    break  # Stop crawling when "No Results Found" message appears
+
+                if not venues:
+                    print(f"No venues extracted from page {page_number}.")
+                    break  # Stop if no venues are extracted
+
+                # Add the venues from this page to the total list
+                all_venues.extend(venues)
+                page_number += 1  # Move to the next page
+
+                # Pause between requests to be polite and avoid rate limits
+                await asyncio.sleep(2)  # Adjust sleep time as needed
 
     # Save the collected venues to a CSV file
     if all_venues:
@@ -75,6 +89,10 @@ async def main():
     """
     Entry point of the script.
     """
+    # Show the crawler's status messages; use logging.DEBUG to trace each venue.
+    # Third-party libraries (httpx, LiteLLM, aiohttp) keep the default WARNING level.
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("utils").setLevel(logging.INFO)
     await crawl_venues()
 
 
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from typing_extensions import NotRequired, TypedDict
 
 
 class Venue(BaseModel):
@@ -6,5 +7,18 @@ class Venue(BaseModel):
     Represents the data structure of a Venue.
     """
 
+    # Immutable once built; unknown keys from the LLM (e.g. 'error') are dropped
+    model_config = ConfigDict(frozen=True, extra="ignore", str_strip_whitespace=True)
+
+    document_name: str
+    document_url: str
+
+
+class VenueRow(TypedDict):
+    """
+    Represents a venue as extracted by the LLM, kept as a plain dict.
+    """
+
     document_name: str
     document_url: str
+    row: NotRequired[int]  # Source page of venues extracted in a batched prompt
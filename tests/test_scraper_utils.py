@@ -0,0 +1,269 @@
+import json
+from urllib.parse import urljoin
+
+import pytest
+from crawl4ai import LLMExtractionStrategy
+
+from models.venue import Venue
+from utils.llm_batch import parse_batch_output
+from utils.scraper_utils import (
+    GERMANY_PATTERN,
+    dispatch_rows,
+    finalize_batch_response,
+    get_url_resolver,
+    has_visible_no_results_message,
+    iter_pdf_links,
+    iter_prompt_batches,
+    parse_page,
+    prepare_batch_request,
+    process_venues,
+    store_llm_result,
+)
+
+BASE_URLS = [
+    "https://a.com/x/page",
+    "https://a.com",
+    "https://a.com/x/",
+    "https://a.com/x/page?q=1",
+]
+
+LINKS = [
+    "b.pdf",
+    "sub/b.pdf",
+    "/b.pdf",
+    "//cdn.com/b.pdf",
+    "https://other.com/b.pdf",
+    "HTTPS://other.com/b.pdf",
+    "../b.pdf",
+    "./b.pdf",
+    "a/../b.pdf",
+    "/a/../b.pdf",
+    "https://other.com/a/./b.pdf",
+    " /lead.pdf",
+    "b\t.pdf",
+    "?page=2",
+    "#top",
+    "",
+    "mailto:info@a.com",
+]
+
+
+@pytest.mark.parametrize("base_url", BASE_URLS)
+@pytest.mark.parametrize("link", LINKS)
+def test_url_resolver_matches_urljoin(base_url, link):
+    assert get_url_resolver(base_url)(link) == urljoin(base_url, link)
+
+
+def test_url_resolver_strips_trailing_whitespace():
+    # urljoin only strips leading whitespace; browsers strip both ends of an href
+    assert get_url_resolver("https://a.com/x/")("b.pdf \n") == "https://a.com/x/b.pdf"
+
+
+@pytest.mark.parametrize(
+    "context",
+    [
+        "/de/iso-9001.pdf Zertifikat",
+        "/cert/iso9001-de.pdf",
+        "https://example.de/cert.pdf",
+        "/cert/iso9001_DE.pdf",
+        "cert.pdf ISO 9001 Germany",
+        "cert.pdf Standort Deutschland",
+    ],
+)
+def test_germany_pattern_matches(context):
+    assert GERMANY_PATTERN.search(context)
+
+
+@pytest.mark.parametrize(
+    "context",
+    [
+        "/es/cert.pdf Certificado ISO 9001 de calidad, España",
+        "/fr/cert.pdf Certificat de qualité",
+        "/cert/design.pdf",
+        "/cert/code.pdf",
+        "/es/certificado-de-calidad-iso-9001.pdf",
+        "/fr/certificat_de_qualite.pdf",
+        "/pt/certificado-de-qualidade.pdf",
+    ],
+)
+def test_germany_pattern_ignores_word_de(context):
+    assert not GERMANY_PATTERN.search(context)
+
+
+@pytest.mark.parametrize(
+    "cleaned_html",
+    [None, "", "  ", "<!-- nothing here -->", '<?xml version="1.0" encoding="utf-8"?><p>x</p>'],
+)
+def test_parse_page_accepts_unparsable_html(cleaned_html):
+    tree, base_url = parse_page(cleaned_html, "https://a.com/x/")
+
+    assert list(iter_pdf_links(tree, base_url)) == []
+    assert base_url == "https://a.com/x/"
+
+
+def test_pdf_links_with_generic_text_are_kept_apart():
+    tree, base_url = parse_page(
+        "<ul>"
+        '<li>Bremen, ISO 9001 <a href="/de/iso9001-bremen.pdf">Download</a></li>'
+        '<li>Duisburg, ISO 9001 <a href="/de/iso9001-duisburg.pdf">Download</a></li>'
+        '<li>Essen, ISO 9001 <a href="/de/iso9001-essen.pdf">Zertifikat Essen</a></li>'
+        "</ul>",
+        "https://a.com/certificates",
+    )
+
+    venues = process_venues(iter_pdf_links(tree, base_url), set())
+
+    assert [venue["document_name"] for venue in venues] == [
+        "Download (iso9001-bremen.pdf)",
+        "Download (iso9001-duisburg.pdf)",
+        "Zertifikat Essen",
+    ]
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (b"<html><body><p>No Results Found</p></body></html>", True),
+        (b"<html><body><script>var t = 'No Results Found';</script></body></html>", False),
+        (b"<html><body><template><p>No Results Found</p></template></body></html>", False),
+        (b"<!-- No Results Found -->", False),
+        (b"<html><body><p>3 results</p></body></html>", False),
+    ],
+)
+def test_has_visible_no_results_message(body, expected):
+    assert has_visible_no_results_message(body) is expected
+
+
+@pytest.fixture
+def llm_strategy():
+    return LLMExtractionStrategy(
+        provider="groq/deepseek-r1-distill-llama-70b",
+        api_token="test",
+        schema=Venue.model_json_schema(),
+        extraction_type="schema",
+        instruction="Extract the venues.",
+    )
+
+
+def make_response(content, finish_reason="stop"):
+    return {
+        "choices": [{"message": {"content": content}, "finish_reason": finish_reason}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+    }
+
+
+def test_prepare_batch_request(llm_strategy):
+    llm_strategy.extra_args = {"max_tokens": 512}
+
+    request = prepare_batch_request(llm_strategy, "page-0-0", "https://a.com/x/", "# Certificates")
+
+    assert request["custom_id"] == "page-0-0"
+    assert request["url"] == "/v1/chat/completions"
+    body = request["body"]
+    assert body["model"] == "deepseek-r1-distill-llama-70b"
+    assert body["temperature"] == 0.01
+    assert body["max_tokens"] == 512
+    prompt = body["messages"][0]["content"]
+    assert "https://a.com/x/" in prompt
+    assert "# Certificates" in prompt
+    assert "Extract the venues." in prompt
+
+
+def test_finalize_batch_response(llm_strategy):
+    response = make_response(
+        "<blocks>["
+        '{"document_name": "A", "document_url": "a.pdf"}, '
+        '{"document_name": "B", "document_url": "b.pdf"}'
+        "]</blocks>"
+    )
+
+    blocks = finalize_batch_response(llm_strategy, response)
+
+    assert blocks == [
+        {"document_name": "A", "document_url": "a.pdf"},
+        {"document_name": "B", "document_url": "b.pdf"},
+    ]
+    assert llm_strategy.total_usage.total_tokens == 15
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (
+            '<blocks>{"document_name": "A", "document_url": "a.pdf"}</blocks>',
+            [{"document_name": "A", "document_url": "a.pdf"}],
+        ),
+        ('<blocks>"none"</blocks>', []),
+        ('<blocks>[["a", "b"]]</blocks>', []),
+    ],
+)
+def test_finalize_batch_response_unusual_blocks(llm_strategy, content, expected):
+    assert finalize_batch_response(llm_strategy, make_response(content)) == expected
+
+
+def test_finalize_batch_response_truncated_is_not_cached(llm_strategy, tmp_path):
+    response = make_response(
+        '<blocks>[{"document_name": "A", "document_url": "a.pdf"}, '
+        '{"document_name": "B", "docu',
+        finish_reason="length",
+    )
+
+    blocks = finalize_batch_response(llm_strategy, response)
+
+    assert blocks[0] == {"document_name": "A", "document_url": "a.pdf"}
+    assert blocks[-1]["error"] is True
+
+    cache_path = tmp_path / "result.json"
+    store_llm_result(cache_path, blocks)
+    assert not cache_path.exists()
+
+
+def test_prompt_batches_stay_within_chunk_token_threshold(llm_strategy):
+    llm_strategy.chunk_token_threshold = 100
+    llm_strategy.word_token_rate = 1
+    sections = [("u1", "word " * 60), ("u1", "word " * 50), ("u2", "word " * 30), ("u3", "x")]
+
+    batches = list(iter_prompt_batches(llm_strategy, sections, batch_size=8))
+
+    assert batches == [sections[:1], sections[1:4]]
+
+
+def test_prompt_batches_respect_batch_size(llm_strategy):
+    sections = [(f"u{i}", "x") for i in range(5)]
+
+    batches = list(iter_prompt_batches(llm_strategy, sections, batch_size=2))
+
+    assert batches == [sections[0:2], sections[2:4], sections[4:]]
+
+
+def test_parse_batch_output_skips_failed_requests():
+    body = make_response("<blocks>[]</blocks>")
+    output_file = "\n".join(
+        json.dumps(line)
+        for line in [
+            {"custom_id": "page-0-0", "response": {"status_code": 200, "body": body}},
+            {"custom_id": "page-1-0", "response": {"status_code": 429, "body": {}}},
+            {"custom_id": "page-2-0", "response": None, "error": {"message": "failed"}},
+        ]
+    )
+
+    assert parse_batch_output("batch_1", output_file + "\n\n") == {"page-0-0": body}
+
+
+def test_dispatch_rows():
+    extracted_data = [
+        {"document_name": "A", "document_url": "a.pdf", "row": 1},
+        {"document_name": "B", "document_url": "b.pdf", "row": "0"},
+        {"document_name": "C", "document_url": "c.pdf"},
+        {"document_name": "D", "document_url": "d.pdf", "row": 5},
+        {"document_name": "E", "document_url": "e.pdf", "row": -1},
+        {"document_name": "F", "document_url": "f.pdf", "row": "first"},
+        {"document_name": "G", "document_url": "g.pdf", "row": None},
+        {"index": 0, "error": True, "tags": ["error"], "content": "..."},
+        "none",
+    ]
+
+    assert dispatch_rows(extracted_data, 2) == [
+        [{"document_name": "B", "document_url": "b.pdf"}],
+        [{"document_name": "A", "document_url": "a.pdf"}],
+    ]
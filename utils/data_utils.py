@@ -3,14 +3,6 @@ import csv
 from models.venue import Venue
 
 
-def is_duplicate_venue(venue_name: str, seen_names: set) -> bool:
-    return venue_name in seen_names
-
-
-def is_complete_venue(venue: dict, required_keys: list) -> bool:
-    return all(key in venue for key in required_keys)
-
-
 def save_venues_to_csv(venues: list, filename: str):
     if not venues:
         print("No venues to save.")
@@ -20,7 +12,8 @@ def save_venues_to_csv(venues: list, filename: str):
     fieldnames = Venue.model_fields.keys()
 
     with open(filename, mode="w", newline="", encoding="utf-8") as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        # Keys outside the model, such as the LLM's 'error' flag, are not written
+        writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
         writer.writerows(venues)
     print(f"Saved {len(venues)} venues to '{filename}'.")
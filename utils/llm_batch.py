@@ -0,0 +1,178 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+
+log = logging.getLogger(__name__)
+
+# OpenAI-compatible endpoints of the Groq API
+# https://console.groq.com/docs/batch
+GROQ_API_BASE = "https://api.groq.com/openai/v1"
+
+# How long to wait for a batch before falling back to per-request mode
+BATCH_TIMEOUT_SECONDS = 60 * 60
+
+# Pause between two batch status checks
+POLL_INTERVAL_SECONDS = 30
+
+# Batch states after which no output will appear anymore
+FAILED_STATES = {"failed", "expired", "cancelling", "cancelled"}
+
+
+def get_auth_headers(api_token: str) -> Dict[str, str]:
+    """
+    Returns the authentication headers for the Groq API.
+
+    Args:
+        api_token (str): The Groq API key.
+
+    Returns:
+        Dict[str, str]: The headers to send with every request.
+    """
+    return {"Authorization": f"Bearer {api_token}"}
+
+
+async def submit_batch(requests: List[dict], api_token: str) -> str:
+    """
+    Uploads chat completion requests and starts a batch job for them.
+
+    Args:
+        requests (List[dict]): The batch requests, one per line of the input file.
+        api_token (str): The Groq API key.
+
+    Returns:
+        str: The identifier of the created batch.
+    """
+    input_file = "\n".join(json.dumps(request, ensure_ascii=False) for request in requests)
+
+    form = aiohttp.FormData()
+    form.add_field("purpose", "batch")
+    form.add_field(
+        "file",
+        input_file.encode("utf-8"),
+        filename="requests.jsonl",
+        content_type="application/jsonl",
+    )
+
+    async with aiohttp.ClientSession(headers=get_auth_headers(api_token)) as session:
+        async with session.post(f"{GROQ_API_BASE}/files", data=form) as response:
+            response.raise_for_status()
+            input_file_id = (await response.json())["id"]
+
+        async with session.post(
+            f"{GROQ_API_BASE}/batches",
+            json={
+                "input_file_id": input_file_id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+        ) as response:
+            response.raise_for_status()
+            batch_id = (await response.json())["id"]
+
+    log.info("Submitted batch %s with %d requests.", batch_id, len(requests))
+    return batch_id
+
+
+async def cancel_batch(batch_id: str, api_token: str) -> None:
+    """
+    Cancels a batch so it stops consuming tokens, logging any failure.
+
+    Args:
+        batch_id (str): The identifier of the batch.
+        api_token (str): The Groq API key.
+    """
+    try:
+        async with aiohttp.ClientSession(headers=get_auth_headers(api_token)) as session:
+            async with session.post(f"{GROQ_API_BASE}/batches/{batch_id}/cancel") as response:
+                response.raise_for_status()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log.error("Could not cancel batch %s: %s", batch_id, e)
+    else:
+        log.info("Cancelled batch %s.", batch_id)
+
+
+async def poll_and_fetch(
+    batch_id: str,
+    api_token: str,
+    timeout: float = BATCH_TIMEOUT_SECONDS,
+    poll_interval: float = POLL_INTERVAL_SECONDS,
+) -> Optional[Dict[str, dict]]:
+    """
+    Waits for a batch to complete and downloads its responses.
+
+    Failed requests to the API are retried until the timeout expires, at
+    which point a batch that is still running is cancelled.
+
+    Args:
+        batch_id (str): The identifier of the batch.
+        api_token (str): The Groq API key.
+        timeout (float): Maximum number of seconds to wait for the batch.
+        poll_interval (float): Number of seconds between two status checks.
+
+    Returns:
+        Optional[Dict[str, dict]]: The chat completion bodies keyed by request `custom_id`, or None if the batch did not complete in time.
+    """
+    deadline = time.monotonic() + timeout
+
+    async with aiohttp.ClientSession(headers=get_auth_headers(api_token)) as session:
+        while True:
+            try:
+                async with session.get(f"{GROQ_API_BASE}/batches/{batch_id}") as response:
+                    response.raise_for_status()
+                    batch = await response.json()
+
+                if batch["status"] in FAILED_STATES:
+                    log.error("Batch %s ended with status '%s'.", batch_id, batch["status"])
+                    return None
+
+                if batch["status"] == "completed":
+                    if not batch.get("output_file_id"):
+                        return {}  # Every request of the batch failed
+
+                    async with session.get(
+                        f"{GROQ_API_BASE}/files/{batch['output_file_id']}/content"
+                    ) as response:
+                        response.raise_for_status()
+                        output_file = await response.text()
+                    break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log.warning("Request for batch %s failed, retrying: %s", batch_id, e)
+
+            if time.monotonic() + poll_interval > deadline:
+                log.warning("Batch %s did not complete in time.", batch_id)
+                await cancel_batch(batch_id, api_token)
+                return None
+
+            await asyncio.sleep(poll_interval)
+
+    return parse_batch_output(batch_id, output_file)
+
+
+def parse_batch_output(batch_id: str, output_file: str) -> Dict[str, dict]:
+    """
+    Reads the chat completions of the successful requests from a batch output file.
+
+    Args:
+        batch_id (str): The identifier of the batch, used in log messages.
+        output_file (str): The JSONL output file of the batch.
+
+    Returns:
+        Dict[str, dict]: The chat completion bodies keyed by request `custom_id`.
+    """
+    responses = {}
+    for line in output_file.splitlines():
+        if not line.strip():
+            continue
+
+        result = json.loads(line)
+        if result.get("error") or result["response"]["status_code"] != 200:
+            log.error("Request %s failed in batch %s.", result["custom_id"], batch_id)
+            continue
+
+        responses[result["custom_id"]] = result["response"]["body"]
+
+    return responses
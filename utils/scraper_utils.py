@@ -1,17 +1,113 @@
+import asyncio
+import copy
+import functools
+import hashlib
+import itertools
 import json
+import logging
 import os
-from typing import List, Set, Tuple
+import re
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlsplit
 
+import aiohttp
+import fastjsonschema
 from crawl4ai import (
     AsyncWebCrawler,
     BrowserConfig,
     CacheMode,
     CrawlerRunConfig,
     LLMExtractionStrategy,
+    RegexChunking,
 )
+from crawl4ai.models import CrawlResult, TokenUsage
+from crawl4ai.prompts import PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION
+from crawl4ai.utils import (
+    escape_json_string,
+    extract_xml_data,
+    sanitize_html,
+    sanitize_input_encode,
+    split_and_parse_json_objects,
+)
+from lxml import etree, html
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from models.venue import Venue, VenueRow
+from utils.llm_batch import (
+    BATCH_TIMEOUT_SECONDS,
+    cancel_batch,
+    poll_and_fetch,
+    submit_batch,
+)
+
+log = logging.getLogger(__name__)
+
+# Maximum number of page sections packed into a single batched LLM prompt,
+# which also stays within the strategy's chunk_token_threshold
+MAX_ROWS_PER_PROMPT = 8
+
+# Maximum number of pages fetched at the same time
+MAX_CONCURRENT_PAGES = 8
 
-from models.venue import Venue
-from utils.data_utils import is_complete_venue, is_duplicate_venue
+# Directory for LLM results keyed by their input; set LLM_CACHE_DIR="" to disable
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llm_cache")
+
+# Message the site shows once a listing has run out of results
+NO_RESULTS_MESSAGE = "No Results Found"
+
+# Time limit for plain HTTP fetches made without the browser
+_STATIC_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Empty mount points of client-side rendered apps (React, Vue, Next.js)
+_JS_SHELL_PATTERN = re.compile(rb'(?i)<div id="(?:root|app|__next)">\s*</div>')
+
+# Hints that a PDF link belongs to a German location / to an ISO 9001 certificate
+# "de" only counts as a "/de/" path segment, a "-de.pdf" suffix or a ".de" host,
+# since it is also a common word in Spanish, French and Portuguese slugs
+GERMANY_PATTERN = re.compile(
+    r"(?i)\b(?:germany|deutschland)\b|/de/|[-_]de\.pdf\b|\.de(?=[/:?#\s]|$)"
+)
+ISO_9001_PATTERN = re.compile(r"(?i)\biso[\s-]*9001\b")
+
+# Anchors whose href mentions ".pdf", matched case-insensitively
+_PDF_ANCHOR_XPATH = (
+    "descendant-or-self::a[contains(translate(@href, 'PDF', 'pdf'), '.pdf')]"
+)
+
+# Link texts that say nothing about the document, e.g. "Download PDF"
+_GENERIC_LINK_WORDS = frozenset(
+    {"download", "herunterladen", "pdf", "here", "hier", "link", "view", "open", "öffnen"}
+)
+
+# Instruction for the LLM; relative links are resolved afterwards, not by the model
+_INSTRUCTION = (
+    "Extract the ISO 9001 PDF documents for locations in Germany as objects with "
+    "'document_name' and 'document_url'. Copy the links as written; they may be relative."
+)
+
+# Do not use cached data unless CRAWL_CACHE names another mode, e.g. ENABLED
+_CRAWL_CACHE = os.getenv("CRAWL_CACHE", "BYPASS")
+try:
+    _CACHE_MODE = CacheMode[_CRAWL_CACHE.upper()]
+except KeyError:
+    raise ValueError(
+        f"CRAWL_CACHE must be one of {', '.join(mode.name for mode in CacheMode)}, "
+        f"got {_CRAWL_CACHE!r}"
+    ) from None
+
+# Shared run configuration; get_run_config() hands out adjusted shallow copies
+# https://docs.crawl4ai.com/api/parameters/
+_BASE_RUN_CONFIG = CrawlerRunConfig(cache_mode=_CACHE_MODE)
+
+# JSON schema of the Venue model and its validator, built once at import time
+_VENUE_SCHEMA = Venue.model_json_schema()
+_VENUE_VALIDATE = fastjsonschema.compile(_VENUE_SCHEMA)
+
+# Decoder for cached LLM results, specialized to a list of venue rows
+_VENUE_ROWS = TypeAdapter(List[VenueRow])
 
 
 def get_browser_config() -> BrowserConfig:
@@ -24,11 +120,27 @@ def get_browser_config() -> BrowserConfig:
     # https://docs.crawl4ai.com/core/browser-crawler-config/
     return BrowserConfig(
         browser_type="chromium",  # Type of browser to simulate
-        headless=False,  # Whether to run in headless mode (no GUI)
+        headless=os.getenv("CRAWL_HEADLESS", "1") != "0",  # Whether to run in headless mode (no GUI)
         verbose=True,  # Enable verbose logging
     )
 
 
+def get_run_config(**overrides) -> CrawlerRunConfig:
+    """
+    Returns a crawler run configuration with the given settings applied.
+
+    Args:
+        **overrides: Attributes to set on the copy, e.g. `session_id`.
+
+    Returns:
+        CrawlerRunConfig: The configuration for a single `crawler.arun` call.
+    """
+    config = copy.copy(_BASE_RUN_CONFIG)
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return config
+
+
 def get_llm_strategy() -> LLMExtractionStrategy:
     """
     Returns the configuration for the language model extraction strategy.
@@ -40,21 +152,78 @@ def get_llm_strategy() -> LLMExtractionStrategy:
     return LLMExtractionStrategy(
         provider="groq/deepseek-r1-distill-llama-70b",  # Name of the LLM provider
         api_token=os.getenv("GROQ_API_KEY"),  # API token for authentication
-        schema=Venue.model_json_schema(),  # JSON schema of the data model
+        schema=_VENUE_SCHEMA,  # JSON schema of the data model
         extraction_type="schema",  # Type of extraction to perform
-        instruction=(
-            """
-            Extract all venue objects with 'document_name' and 'document_url' of the ISO 9001 documents from the 
-            following content. 
-            Only retrieve the links relevant to germany location and take care that you take the PDF links which are working for download. 
-            Means check on the content what the base-url is and add the relative path to the base-url.
-            """
-        ),  # Instructions for the LLM
+        instruction=_INSTRUCTION,  # Instructions for the LLM
         input_format="markdown",  # Format of the input content
         verbose=True,  # Enable verbose logging
     )
 
 
+def has_no_results_message(page_html: Optional[str]) -> bool:
+    """
+    Checks page HTML for the "No Results Found" message.
+
+    Args:
+        page_html (Optional[str]): The HTML of the page.
+
+    Returns:
+        bool: True if "No Results Found" message is found, False otherwise.
+    """
+    return bool(page_html) and NO_RESULTS_MESSAGE in page_html
+
+
+def has_visible_no_results_message(body: bytes) -> bool:
+    """
+    Checks a raw HTTP response body for a visible "No Results Found" message.
+
+    Args:
+        body (bytes): The page body.
+
+    Returns:
+        bool: True if the message appears outside scripts, styles and templates, False otherwise.
+    """
+    if NO_RESULTS_MESSAGE.encode() not in body:
+        return False
+
+    try:
+        tree = html.document_fromstring(body)
+    except (etree.ParserError, ValueError):
+        return False  # Nothing but comments or whitespace
+
+    # Scripts and templates may ship the message for pages that do have results
+    for element in tree.xpath("//script | //style | //template | //noscript"):
+        element.drop_tree()
+    return NO_RESULTS_MESSAGE in tree.text_content()
+
+
+async def fetch_static_page(url: str) -> Optional[bytes]:
+    """
+    Fetches a page over plain HTTP, without starting a browser.
+
+    Args:
+        url (str): The URL to fetch.
+
+    Returns:
+        Optional[bytes]: The page body, or None if the request failed or the page is rendered by JavaScript.
+    """
+    try:
+        async with aiohttp.ClientSession(timeout=_STATIC_FETCH_TIMEOUT) as session:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return None
+                body = await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log.debug("Plain HTTP fetch of %s failed: %s", url, e)
+        return None
+
+    # An empty app container means the content only appears after JavaScript runs
+    if _JS_SHELL_PATTERN.search(body):
+        return None
+
+    return body
+
+
 async def check_no_results(
     crawler: AsyncWebCrawler,
     url: str,
@@ -63,6 +232,12 @@ async def check_no_results(
     """
     Checks if the "No Results Found" message is present on the page.
 
+    The page is requested over plain HTTP first; the browser is only used
+    when that fails or the page is rendered by JavaScript.
+
+    Deprecated: `fetch_and_process_page` runs this check on the page it has
+    already fetched, which saves a second navigation.
+
     Args:
         crawler (AsyncWebCrawler): The web crawler instance.
         url (str): The URL to check.
@@ -71,21 +246,31 @@ async def check_no_results(
     Returns:
         bool: True if "No Results Found" message is found, False otherwise.
     """
+    warnings.warn(
+        "check_no_results() is deprecated; fetch_and_process_page() already "
+        "checks the fetched page for the 'No Results Found' message.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
+    # Server-rendered pages can be checked with a plain HTTP request
+    body = await fetch_static_page(url)
+    if body is not None:
+        return has_visible_no_results_message(body)
+
     # Fetch the page without any CSS selector or extraction strategy
     result = await crawler.arun(
         url=url,
-        config=CrawlerRunConfig(
-            cache_mode=CacheMode.BYPASS,
-            session_id=session_id,
-        ),
+        config=get_run_config(session_id=session_id),
     )
 
     if result.success:
-        if "No Results Found" in result.cleaned_html:
+        if has_no_results_message(result.cleaned_html):
             return True
     else:
-        print(
-            f"Error fetching page for 'No Results Found' check: {result.error_message}"
+        log.error(
+            "Error fetching page for 'No Results Found' check: %s",
+            result.error_message,
         )
 
     return False
@@ -97,7 +282,6 @@ async def fetch_and_process_page(
     css_selector: str,
     llm_strategy: LLMExtractionStrategy,
     session_id: str,
-    required_keys: List[str],
     seen_names: Set[str],
 ) -> Tuple[List[dict], bool]:
     """
@@ -109,65 +293,834 @@ async def fetch_and_process_page(
         css_selector (str): The CSS selector to target the content.
         llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
         session_id (str): The session identifier.
-        required_keys (List[str]): List of required keys in the venue data.
         seen_names (Set[str]): Set of venue names that have already been seen.
 
     Returns:
         Tuple[List[dict], bool]: A tuple containing a list of processed venues and a boolean indicating whether "No Results Found" was encountered.
     """
-    print(f"Loading URL: {base_url}")
+    log.info("Loading URL: %s", base_url)
 
-    # Fetch page content with the extraction strategy
-    result = await crawler.arun(
+    # Fetch the page content without an extraction strategy
+    initial_result = await crawler.arun(
         url=base_url,
-        config=CrawlerRunConfig(
-            cache_mode=CacheMode.BYPASS,  # Do not use cached data
-            extraction_strategy=llm_strategy,  # Strategy for data extraction
+        config=get_run_config(
             css_selector=css_selector,  # Target specific content on the page
             session_id=session_id,  # Unique session ID for the crawl
         ),
     )
 
-    if not (result.success and result.extracted_content):
-        print(f"Error fetching URL: {result.error_message}")
+    if not initial_result.success:
+        log.error("Error fetching URL: %s", initial_result.error_message)
         return [], False
 
-    # Parse extracted content
-    extracted_data = json.loads(result.extracted_content)
-    if not extracted_data:
-        print("No venues found.")
-        return [], False
+    tree, page_base_url = parse_page(initial_result.cleaned_html, base_url)
 
-    # After parsing extracted content
-    print("Extracted data:", extracted_data)
+    # Read the PDF links straight from the DOM; only ask the LLM if none match
+    pdf_links = iter_pdf_links(tree, page_base_url)
+    first_link = next(pdf_links, None)
+    if first_link is not None:
+        # Stream the links into process_venues without collecting them first
+        extracted_data = itertools.chain((first_link,), pdf_links)
+    else:
+        log.info("No PDF links found in the page, falling back to the LLM.")
+
+        # Extract from the markdown fetched above instead of navigating again
+        extracted_data = await run_llm_extraction(
+            llm_strategy, base_url, initial_result.markdown or ""
+        )
+        if not extracted_data:
+            log.info("No venues found.")
+            return [], False
+
+        resolve_venue_urls(extracted_data, page_base_url)
 
     # Process venues
+    complete_venues = process_venues(extracted_data, seen_names)
+
+    if not complete_venues:
+        log.info("No complete venues found.")
+        return [], False
+
+    # Check for "No Results Found" message on the page fetched above
+    no_results_found = has_no_results_message(initial_result.cleaned_html)
+
+    log.info("Extracted %d venues.", len(complete_venues))
+    return complete_venues, no_results_found
+
+
+async def fetch_and_process_many(
+    crawler: AsyncWebCrawler,
+    urls: List[str],
+    css_selector: str,
+    llm_strategy: LLMExtractionStrategy,
+    session_id: str,
+    seen_names: Set[str],
+    concurrency: int = MAX_CONCURRENT_PAGES,
+) -> List[Tuple[List[dict], bool]]:
+    """
+    Fetches and processes several URLs concurrently.
+
+    Args:
+        crawler (AsyncWebCrawler): The web crawler instance.
+        urls (List[str]): The URLs to scrape.
+        css_selector (str): The CSS selector to target the content.
+        llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
+        session_id (str): Prefix for the per-URL session identifiers.
+        seen_names (Set[str]): Set of venue names that have already been seen.
+        concurrency (int): Maximum number of pages processed at the same time.
+
+    Returns:
+        List[Tuple[List[dict], bool]]: The result of `fetch_and_process_page` for each URL, in order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def process_one(index: int, url: str) -> Tuple[List[dict], bool]:
+        # Give each task its own browser page so crawl4ai does not serialize them
+        page_session_id = f"{session_id}_{index}"
+        async with semaphore:
+            try:
+                return await fetch_and_process_page(
+                    crawler,
+                    url,
+                    css_selector,
+                    llm_strategy,
+                    page_session_id,
+                    seen_names,
+                )
+            finally:
+                await crawler.crawler_strategy.kill_session(page_session_id)
+
+    return await asyncio.gather(
+        *(process_one(index, url) for index, url in enumerate(urls))
+    )
+
+
+async def run_llm_extraction(
+    llm_strategy: LLMExtractionStrategy,
+    url: str,
+    markdown: str,
+) -> List[dict]:
+    """
+    Runs the LLM extraction on already fetched page content.
+
+    Mirrors what `crawler.arun` does with an extraction strategy, without
+    loading the page in the browser again.
+
+    Args:
+        llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
+        url (str): The URL the content was fetched from.
+        markdown (str): The markdown of the page.
+
+    Returns:
+        List[dict]: The venues returned by the LLM, or an empty list if the call failed.
+    """
+    sections = RegexChunking().chunk(markdown)
+    try:
+        return await run_llm_cached(
+            llm_strategy, markdown, llm_strategy.run, url, sections
+        )
+    except Exception as e:
+        # crawler.arun used to report these as a failed result instead of raising
+        log.error("Error extracting venues from %s: %s", url, e)
+        return []
+
+
+def get_llm_cache_path(
+    llm_strategy: LLMExtractionStrategy, content: str
+) -> Optional[Path]:
+    """
+    Returns the cache file for an LLM call on the given content.
+
+    The key covers everything that determines the answer: the model and its
+    extra arguments, the instruction, the schema, the chunking settings and
+    the content itself.
+
+    Args:
+        llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
+        content (str): The content sent to the LLM.
+
+    Returns:
+        Optional[Path]: The cache file, or None if caching is disabled.
+    """
+    if not LLM_CACHE_DIR:
+        return None
+
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        llm_strategy.provider,
+        json.dumps(llm_strategy.extra_args, sort_keys=True),
+        llm_strategy.instruction or "",
+        json.dumps(llm_strategy.schema, sort_keys=True),
+        str(llm_strategy.chunk_token_threshold),
+        str(llm_strategy.overlap_rate),
+        content,
+    ):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")  # Keep the parts from running into each other
+    return Path(LLM_CACHE_DIR) / f"{digest.hexdigest()}.json"
+
+
+async def run_llm_cached(
+    llm_strategy: LLMExtractionStrategy,
+    content: str,
+    extract: Callable[..., List[Dict[str, Any]]],
+    *args: Any,
+) -> List[dict]:
+    """
+    Runs an LLM extraction, reusing the stored result for content seen before.
+
+    Args:
+        llm_strategy (LLMExtractionStrategy): The strategy that performs the call.
+        content (str): The content sent to the LLM, used as the cache key.
+        extract (Callable[..., List[Dict[str, Any]]]): The blocking extraction method to run.
+        *args (Any): Arguments passed on to `extract`.
+
+    Returns:
+        List[dict]: The extracted blocks.
+    """
+    cache_path = get_llm_cache_path(llm_strategy, content)
+    venues = load_llm_result(cache_path)
+    if venues is not None:
+        return venues
+
+    # The strategy calls the LLM synchronously, so keep it off the event loop
+    blocks = await asyncio.to_thread(extract, *args)
+    store_llm_result(cache_path, blocks)
+    return blocks
+
+
+def load_llm_result(cache_path: Optional[Path]) -> Optional[List[dict]]:
+    """
+    Reads a stored LLM result.
+
+    Args:
+        cache_path (Optional[Path]): The cache file, or None if caching is disabled.
+
+    Returns:
+        Optional[List[dict]]: The stored venues, or None if there is no usable entry.
+    """
+    if cache_path is None or not cache_path.exists():
+        return None
+
+    try:
+        venues = _VENUE_ROWS.validate_json(cache_path.read_bytes())
+    except ValidationError:
+        log.warning("Ignoring invalid cached LLM result %s", cache_path.name)
+        return None
+
+    log.info("Using cached LLM result %s", cache_path.name)
+    return venues
+
+
+def store_llm_result(cache_path: Optional[Path], blocks: List[Any]) -> None:
+    """
+    Stores an LLM result unless it contains error blocks.
+
+    Args:
+        cache_path (Optional[Path]): The cache file, or None if caching is disabled.
+        blocks (List[Any]): The blocks returned by the LLM.
+    """
+    # Only store complete answers, so failed calls are retried on the next run
+    if cache_path is None or any(
+        isinstance(block, dict) and block.get("error") is True for block in blocks
+    ):
+        return
+
+    # Rows that are not venues would be dropped later anyway
+    venues = [block for block in blocks if is_valid_venue(block)]
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(venues, ensure_ascii=False), encoding="utf-8")
+
+
+def parse_page(cleaned_html: Optional[str], url: str) -> Tuple[html.HtmlElement, str]:
+    """
+    Parses a fetched page and works out the URL its links are relative to.
+
+    Args:
+        cleaned_html (Optional[str]): The cleaned HTML of the page.
+        url (str): The URL the page was fetched from.
+
+    Returns:
+        Tuple[html.HtmlElement, str]: The parsed page and its base URL.
+    """
+    try:
+        tree = html.fromstring((cleaned_html or "").strip())
+    except (etree.ParserError, ValueError):
+        # Empty or comment-only input, or a str with an XML encoding declaration
+        tree = html.fromstring("<html></html>")
+
+    # Resolve links against the page's <base> tag when it declares one
+    base_tag = tree.find(".//base[@href]")
+    base_url = urljoin(url, base_tag.get("href")) if base_tag is not None else url
+    return tree, base_url
+
+
+def iter_pdf_links(tree: html.HtmlElement, base_url: str) -> Iterator[dict]:
+    """
+    Yields venues for the German ISO 9001 PDF links of a parsed page.
+
+    The venues are not validated here; `process_venues` checks every row.
+
+    Args:
+        tree (html.HtmlElement): The parsed page content.
+        base_url (str): The URL relative links are resolved against.
+
+    Yields:
+        dict: A venue built from a matching link.
+    """
+    resolve_url = get_url_resolver(base_url)
+    for anchor in tree.xpath(_PDF_ANCHOR_XPATH):
+        href = anchor.get("href")
+
+        # Match the hints against the link and the text surrounding it
+        parent = anchor.getparent()
+        context_node = parent if parent is not None else anchor
+        context = f"{href} {' '.join(context_node.itertext())}"
+        if not (GERMANY_PATTERN.search(context) and ISO_9001_PATTERN.search(context)):
+            continue
+
+        document_url = resolve_url(href)
+        document_name = " ".join(anchor.text_content().split())
+        if _GENERIC_LINK_WORDS.issuperset(re.findall(r"\w+", document_name.casefold())):
+            # Duplicates are detected by name, so generic texts would hide other documents
+            file_name = urlsplit(document_url).path.rsplit("/", 1)[-1]
+            document_name = f"{document_name} ({file_name})" if document_name else file_name
+
+        yield {"document_name": document_name, "document_url": document_url}
+
+
+def get_url_resolver(base_url: str) -> Callable[[str], str]:
+    """
+    Returns a function that makes links absolute with respect to base_url.
+
+    The base URL is split once, so the common link shapes are resolved with
+    string prefixes instead of a full `urljoin` per link.
+
+    Args:
+        base_url (str): The URL relative links are resolved against.
+
+    Returns:
+        Callable[[str], str]: Maps a possibly relative link to an absolute URL.
+    """
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    directory = origin + (parts.path[: parts.path.rfind("/") + 1] or "/")
+
+    def resolve_url(url: str) -> str:
+        url = url.strip()
+        if "/." in url or any(char in url for char in "\t\r\n"):
+            return urljoin(base_url, url)  # Dot segments and embedded control characters
+        if url.startswith(("http://", "https://")):
+            return url  # Already absolute
+        if url.startswith("//"):
+            return f"{parts.scheme}:{url}"  # Protocol-relative
+        if url.startswith("/"):
+            return origin + url  # Relative to the host
+        if not url or url.startswith((".", "?", "#")) or ":" in url.split("/", 1)[0]:
+            return urljoin(base_url, url)  # Dot segments, queries, other schemes
+        return directory + url  # Relative to the current directory
+
+    return resolve_url
+
+
+def resolve_venue_urls(venues: List[Any], base_url: str) -> None:
+    """
+    Turns relative document URLs returned by the LLM into absolute ones.
+
+    Args:
+        venues (List[Any]): The blocks to update in place; only objects are touched.
+        base_url (str): The URL relative links are resolved against.
+    """
+    resolve_url = get_url_resolver(base_url)
+    for venue in venues:
+        # The LLM may return other JSON values next to the venue objects
+        if isinstance(venue, dict) and isinstance(venue.get("document_url"), str):
+            venue["document_url"] = resolve_url(venue["document_url"])
+
+
+def is_valid_venue(venue: Any) -> bool:
+    """
+    Checks a venue against the JSON schema of the Venue model.
+
+    Args:
+        venue (Any): The extracted venue.
+
+    Returns:
+        bool: True if the venue matches the schema, False otherwise.
+    """
+    try:
+        _VENUE_VALIDATE(venue)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
+
+
+def process_venues(
+    extracted_data: Iterable[dict],
+    seen_names: Set[str],
+) -> List[dict]:
+    """
+    Filters extracted venues down to complete, previously unseen ones.
+
+    Args:
+        extracted_data (Iterable[dict]): The extracted venues, consumed in a single pass.
+        seen_names (Set[str]): Set of venue names that have already been seen.
+
+    Returns:
+        List[dict]: The complete, non-duplicate venues.
+    """
+    debug = log.isEnabledFor(logging.DEBUG)
     complete_venues = []
     for venue in extracted_data:
-        # Debugging: Print each venue to understand its structure
-        print("Processing venue:", venue)
-
-        # Ignore the 'error' key if it's False
-        if venue.get("error") is False:
-            venue.pop("error", None)  # Remove the 'error' key if it's False
+        # Debugging: Log each venue to understand its structure
+        if debug:
+            log.debug("Processing venue: %r", venue)
 
-        if not is_complete_venue(venue, required_keys):
-            continue  # Skip incomplete venues
+        if not is_valid_venue(venue):
+            continue  # Skip venues that do not match the Venue schema
 
-        if is_duplicate_venue(venue["document_name"], seen_names):
-            print(f"Duplicate venue '{venue['document_name']}' found. Skipping.")
+        # Record the name and detect duplicates with a single set operation
+        seen_count = len(seen_names)
+        seen_names.add(venue["document_name"])
+        if len(seen_names) == seen_count:
+            if debug:
+                log.debug("Duplicate venue '%s' found. Skipping.", venue["document_name"])
             continue  # Skip duplicate venues
 
         # Add venue to the list
-        seen_names.add(venue["document_name"])
         complete_venues.append(venue)
 
-    if not complete_venues:
-        print("No complete venues found.")
-        return [], False
+    return complete_venues
 
-    # Check for "No Results Found" message
-    no_results_found = await check_no_results(crawler, base_url, session_id)
-    
-    print(f"Extracted {len(complete_venues)} venues.")
-    return complete_venues, no_results_found
+
+@functools.lru_cache(maxsize=16)
+def get_batch_instruction(instruction: str) -> str:
+    """
+    Extends an instruction with the row tagging rules for batched prompts.
+
+    Cached, so repeated batches reuse the same string instead of rebuilding it.
+
+    Args:
+        instruction (str): The instruction of the single-page strategy.
+
+    Returns:
+        str: The instruction to use for batched prompts.
+    """
+    return (
+        f"{instruction}\n"
+        "The content consists of several pages, each starting with a "
+        "'<<<ROW n url=...>>>' marker. Add a 'row' field holding n to every "
+        "extracted object."
+    )
+
+
+def get_batch_strategy(llm_strategy: LLMExtractionStrategy) -> LLMExtractionStrategy:
+    """
+    Derives a strategy that tags every extracted venue with its source row.
+
+    The copy shares the usage counters of the original strategy, so
+    `show_usage()` still reports the tokens spent on batched calls.
+
+    Args:
+        llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
+
+    Returns:
+        LLMExtractionStrategy: The strategy to use for batched prompts.
+    """
+    batch_strategy = copy.copy(llm_strategy)
+    batch_strategy.instruction = get_batch_instruction(llm_strategy.instruction)
+    schema = copy.deepcopy(llm_strategy.schema)
+    schema["properties"]["row"] = {"title": "Row", "type": "integer"}
+    schema["required"] = [*schema.get("required", []), "row"]
+    batch_strategy.schema = schema
+    return batch_strategy
+
+
+def build_batch_prompt(pages: List[Tuple[str, str]]) -> str:
+    """
+    Concatenates the markdown of several pages into one delimited prompt.
+
+    Args:
+        pages (List[Tuple[str, str]]): (url, markdown) pairs, one per row; a URL may span several rows.
+
+    Returns:
+        str: The content for a single batched LLM call.
+    """
+    return "\n".join(
+        f"<<<ROW {row} url={url}>>>\n{markdown}"
+        for row, (url, markdown) in enumerate(pages)
+    )
+
+
+def dispatch_rows(extracted_data: List[Any], row_count: int) -> List[List[dict]]:
+    """
+    Sorts the venues of a batched prompt back into the rows they were extracted from.
+
+    Args:
+        extracted_data (List[Any]): The blocks returned for the prompt; their "row" field is removed.
+        row_count (int): The number of rows in the prompt.
+
+    Returns:
+        List[List[dict]]: The venues of each row, in row order.
+    """
+    rows = [[] for _ in range(row_count)]
+    for venue in extracted_data:
+        try:
+            row = int(venue.pop("row"))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            row = -1  # Error blocks and untagged venues carry no usable row
+
+        if 0 <= row < row_count:
+            rows[row].append(venue)
+        else:
+            log.warning("Dropping venue without a valid row: %r", venue)
+
+    return rows
+
+
+def iter_prompt_batches(
+    llm_strategy: LLMExtractionStrategy,
+    sections: List[Tuple[str, str]],
+    batch_size: int = MAX_ROWS_PER_PROMPT,
+) -> Iterator[List[Tuple[str, str]]]:
+    """
+    Groups page sections into batches that fit one LLM prompt.
+
+    Tokens are estimated the way crawl4ai merges chunks, from the word count.
+
+    Args:
+        llm_strategy (LLMExtractionStrategy): The strategy whose chunk token threshold applies.
+        sections (List[Tuple[str, str]]): (url, section) pairs, see `split_into_sections`.
+        batch_size (int): Maximum number of sections in one batch.
+
+    Yields:
+        List[Tuple[str, str]]: The sections of one batched prompt.
+    """
+    batch = []
+    batch_tokens = 0
+    for url, section in sections:
+        tokens = len(section.split(" ")) * llm_strategy.word_token_rate
+        if batch and (
+            len(batch) >= batch_size
+            or batch_tokens + tokens > llm_strategy.chunk_token_threshold
+        ):
+            yield batch
+            batch = []
+            batch_tokens = 0
+
+        batch.append((url, section))
+        batch_tokens += tokens
+
+    if batch:
+        yield batch
+
+
+async def fetch_pages(
+    crawler: AsyncWebCrawler,
+    urls: List[str],
+    css_selector: str,
+    concurrency: int = MAX_CONCURRENT_PAGES,
+) -> List[Tuple[str, CrawlResult]]:
+    """
+    Fetches several URLs concurrently without any extraction strategy.
+
+    Args:
+        crawler (AsyncWebCrawler): The web crawler instance.
+        urls (List[str]): The URLs to fetch.
+        css_selector (str): The CSS selector to target the content.
+        concurrency (int): Maximum number of pages fetched at the same time.
+
+    Returns:
+        List[Tuple[str, CrawlResult]]: The URL and result of every successful fetch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(url: str) -> CrawlResult:
+        # Limit the number of browser pages open at the same time
+        async with semaphore:
+            return await crawler.arun(
+                url=url,
+                config=get_run_config(
+                    css_selector=css_selector,  # Target specific content on the page
+                ),
+            )
+
+    results = await asyncio.gather(*(fetch_one(url) for url in urls))
+
+    pages = []
+    for url, result in zip(urls, results):
+        if result.success:
+            pages.append((url, result))
+        else:
+            log.error("Error fetching URL %s: %s", url, result.error_message)
+
+    return pages
+
+
+async def fetch_and_process_pages(
+    crawler: AsyncWebCrawler,
+    urls: List[str],
+    css_selector: str,
+    llm_strategy: LLMExtractionStrategy,
+    seen_names: Set[str],
+    batch_size: int = MAX_ROWS_PER_PROMPT,
+) -> Dict[str, List[dict]]:
+    """
+    Fetches several URLs concurrently and extracts their venues in batched LLM calls.
+
+    Pages are split into sections as crawl4ai would for a single page, and
+    each prompt holds as many sections as fit the strategy's chunk token
+    threshold, up to `batch_size`.
+
+    Args:
+        crawler (AsyncWebCrawler): The web crawler instance.
+        urls (List[str]): The URLs to scrape.
+        css_selector (str): The CSS selector to target the content.
+        llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
+        seen_names (Set[str]): Set of venue names that have already been seen.
+        batch_size (int): Maximum number of page sections sent in one LLM prompt.
+
+    Returns:
+        Dict[str, List[dict]]: The processed venues keyed by their source URL.
+    """
+    log.info("Loading %d URLs", len(urls))
+
+    # Fetch all pages without extraction; the LLM is called once per batch below
+    sections = [
+        (url, section)
+        for url, result in await fetch_pages(crawler, urls, css_selector)
+        if result.markdown
+        for section in split_into_sections(llm_strategy, result.markdown)
+    ]
+
+    batch_strategy = get_batch_strategy(llm_strategy)
+    venues_by_url = {url: [] for url in urls}
+    for ix, batch in enumerate(iter_prompt_batches(llm_strategy, sections, batch_size)):
+        prompt = build_batch_prompt(batch)
+        try:
+            extracted_data = await run_llm_cached(
+                batch_strategy,
+                prompt,
+                batch_strategy.extract,
+                batch[0][0],
+                ix,
+                prompt,
+            )
+        except Exception as e:
+            # Keep the venues of the other batches; these pages record none
+            log.error("Error extracting venues from %s: %s", [url for url, _ in batch], e)
+            extracted_data = []
+
+        # Dispatch venues back to the page they were extracted from
+        for (url, _), row_venues in zip(batch, dispatch_rows(extracted_data, len(batch))):
+            resolve_venue_urls(row_venues, url)
+            venues_by_url[url].extend(process_venues(row_venues, seen_names))
+
+    log.info("Extracted %d venues.", sum(map(len, venues_by_url.values())))
+    return venues_by_url
+
+
+def split_into_sections(llm_strategy: LLMExtractionStrategy, markdown: str) -> List[str]:
+    """
+    Splits page markdown into the sections crawl4ai sends to the LLM one by one.
+
+    Args:
+        llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
+        markdown (str): The markdown of the page.
+
+    Returns:
+        List[str]: The non-empty sections, merged up to the strategy's chunk token threshold.
+    """
+    # Same chunking and merging as crawler.arun followed by LLMExtractionStrategy.run
+    sections = llm_strategy._merge(
+        RegexChunking().chunk(markdown),
+        llm_strategy.chunk_token_threshold,
+        overlap=int(llm_strategy.chunk_token_threshold * llm_strategy.overlap_rate),
+    )
+    # _merge starts with an empty section when the first chunk exceeds the threshold
+    return [sanitize_input_encode(section) for section in sections if section.strip()]
+
+
+def prepare_batch_request(
+    llm_strategy: LLMExtractionStrategy,
+    custom_id: str,
+    url: str,
+    section: str,
+) -> dict:
+    """
+    Builds the batch API request that extracts the venues of one page section.
+
+    The request carries the prompt and temperature crawl4ai uses for a live
+    schema extraction.
+
+    Args:
+        llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
+        custom_id (str): Identifier that links the response back to the section.
+        url (str): The URL the content was fetched from.
+        section (str): A section of the page markdown, see `split_into_sections`.
+
+    Returns:
+        dict: One line of the batch input file.
+    """
+    prompt = PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION
+    for name, value in {
+        "URL": url,
+        "HTML": escape_json_string(sanitize_html(section)),
+        "REQUEST": llm_strategy.instruction,
+        "SCHEMA": json.dumps(llm_strategy.schema, indent=2),
+    }.items():
+        prompt = prompt.replace("{" + name + "}", value)
+
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": llm_strategy.provider.split("/", 1)[-1],  # Drop the "groq/" prefix
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.01,  # crawl4ai's default for extraction calls
+            **llm_strategy.extra_args,
+        },
+    }
+
+
+def finalize_batch_response(
+    llm_strategy: LLMExtractionStrategy,
+    response: dict,
+) -> List[dict]:
+    """
+    Turns a batch API response into venue blocks, as crawl4ai does for live calls.
+
+    Replies that are malformed or cut off at the token limit get an error
+    block, like crawl4ai adds for live calls, so they are not cached.
+
+    Args:
+        llm_strategy (LLMExtractionStrategy): The strategy whose usage statistics are updated.
+        response (dict): The chat completion returned for a page section.
+
+    Returns:
+        List[dict]: The blocks returned by the LLM.
+    """
+    usage = response.get("usage") or {}
+    llm_strategy.usages.append(
+        TokenUsage(
+            completion_tokens=usage.get("completion_tokens", 0),
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+        )
+    )
+    llm_strategy.total_usage.completion_tokens += usage.get("completion_tokens", 0)
+    llm_strategy.total_usage.prompt_tokens += usage.get("prompt_tokens", 0)
+    llm_strategy.total_usage.total_tokens += usage.get("total_tokens", 0)
+
+    choice = response["choices"][0]
+    content = choice["message"]["content"]
+    unparsed = None
+    try:
+        blocks = from_json(extract_xml_data(["blocks"], content)["blocks"])
+    except ValueError:
+        # Keep the complete objects; the cut-off or malformed rest becomes an error block
+        blocks, unparsed = split_and_parse_json_objects(content)
+        unparsed = unparsed or content
+
+    if isinstance(blocks, dict):
+        blocks = [blocks]  # A single venue returned as a bare object
+    elif not isinstance(blocks, list):
+        blocks = []  # A bare string or number holds no venues
+    blocks = [block for block in blocks if isinstance(block, dict)]
+
+    if choice.get("finish_reason") == "length":
+        unparsed = unparsed or content  # The reply hit max_tokens before it was complete
+
+    # Error blocks keep incomplete answers out of the LLM cache
+    if unparsed:
+        blocks.append({"index": 0, "error": True, "tags": ["error"], "content": unparsed})
+
+    return blocks
+
+
+async def fetch_and_process_pages_batched(
+    crawler: AsyncWebCrawler,
+    urls: List[str],
+    css_selector: str,
+    llm_strategy: LLMExtractionStrategy,
+    seen_names: Set[str],
+    timeout: float = BATCH_TIMEOUT_SECONDS,
+) -> Dict[str, List[dict]]:
+    """
+    Fetches several URLs and extracts their venues through the Groq batch API.
+
+    Pages with matching PDF links or a cached LLM result are processed right
+    away. The others are submitted as one batch job, which is cheaper than
+    live calls but can take a while; pages without a complete batch response
+    within `timeout` seconds fall back to live LLM calls.
+
+    Args:
+        crawler (AsyncWebCrawler): The web crawler instance.
+        urls (List[str]): The URLs to scrape.
+        css_selector (str): The CSS selector to target the content.
+        llm_strategy (LLMExtractionStrategy): The LLM extraction strategy.
+        seen_names (Set[str]): Set of venue names that have already been seen.
+        timeout (float): Maximum number of seconds to wait for the batch.
+
+    Returns:
+        Dict[str, List[dict]]: The processed venues keyed by their source URL.
+    """
+    log.info("Loading %d URLs", len(urls))
+
+    venues_by_url = {url: [] for url in urls}
+    pending = []  # Pages left for the LLM, with the custom_id of each section
+    requests = []
+    for index, (url, result) in enumerate(await fetch_pages(crawler, urls, css_selector)):
+        tree, page_base_url = parse_page(result.cleaned_html, url)
+        pdf_links = list(iter_pdf_links(tree, page_base_url))
+        if pdf_links:
+            venues_by_url[url] = process_venues(pdf_links, seen_names)
+            continue
+
+        if not result.markdown:
+            continue
+
+        # Share the cache with the live path, which keys it by the page markdown
+        cache_path = get_llm_cache_path(llm_strategy, result.markdown)
+        extracted_data = load_llm_result(cache_path)
+        if extracted_data is not None:
+            resolve_venue_urls(extracted_data, page_base_url)
+            venues_by_url[url] = process_venues(extracted_data, seen_names)
+            continue
+
+        custom_ids = []
+        for ix, section in enumerate(split_into_sections(llm_strategy, result.markdown)):
+            custom_ids.append(f"page-{index}-{ix}")
+            requests.append(prepare_batch_request(llm_strategy, custom_ids[-1], url, section))
+        pending.append((url, page_base_url, result.markdown, cache_path, custom_ids))
+
+    responses = {}
+    if requests:
+        batch_id = None
+        try:
+            batch_id = await submit_batch(requests, llm_strategy.api_token)
+            responses = await poll_and_fetch(batch_id, llm_strategy.api_token, timeout) or {}
+        except Exception as e:
+            log.error("Batch API request failed: %s", e)
+            if batch_id is not None:
+                # Stop the batch so the live fallback below is not paid for twice
+                await cancel_batch(batch_id, llm_strategy.api_token)
+
+    for url, page_base_url, markdown, cache_path, custom_ids in pending:
+        if all(custom_id in responses for custom_id in custom_ids):
+            extracted_data = []
+            for custom_id in custom_ids:
+                extracted_data.extend(
+                    finalize_batch_response(llm_strategy, responses[custom_id])
+                )
+            store_llm_result(cache_path, extracted_data)
+        else:
+            log.info("No batch response for %s, falling back to a live LLM call.", url)
+            extracted_data = await run_llm_extraction(llm_strategy, url, markdown)
+
+        resolve_venue_urls(extracted_data, page_base_url)
+        venues_by_url[url] = process_venues(extracted_data, seen_names)
+
+    log.info("Extracted %d venues.", sum(map(len, venues_by_url.values())))
+    return venues_by_url